@@ -0,0 +1,101 @@
+import copy
+from collections.abc import Iterator, Mapping, Sequence
+from typing import Any
+
+import pytest
+
+from cvec import CVec
+from tests.stubs import (
+    API_KEY,
+    QueryTableRecorder,
+    QueryTableStub,
+    RequestRecorder,
+    RequestStub,
+    RPCRecorder,
+    RPCStub,
+)
+
+
+def _stub_fetch_config(self: CVec) -> str:
+    """Stand-in for _fetch_config that sets tenant_id without a network call."""
+    self._tenant_id = 1
+    return "test_publishable_key"
+
+
+def _stub_login_with_supabase(self: CVec, email: str, password: str) -> None:
+    """Stand-in for _login_with_supabase that skips authentication."""
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _stub_cvec_auth() -> Iterator[None]:
+    """Keep CVec construction offline by stubbing config fetch and login.
+
+    The stubs hold no state, so they are installed once for the whole session
+    with plain attribute swaps and restored on teardown. Tests that need a
+    different stand-in can still patch over them.
+    """
+    fetch_config = CVec._fetch_config
+    login_with_supabase = CVec._login_with_supabase
+    CVec._fetch_config = _stub_fetch_config  # type: ignore[method-assign]
+    CVec._login_with_supabase = _stub_login_with_supabase  # type: ignore[method-assign]
+    try:
+        yield
+    finally:
+        CVec._fetch_config = fetch_config  # type: ignore[method-assign]
+        CVec._login_with_supabase = login_with_supabase  # type: ignore[method-assign]
+
+
+@pytest.fixture(scope="session")
+def _prototype(_stub_cvec_auth: None) -> CVec:
+    """A CVec client built once per session for ``client`` to copy."""
+    return CVec(host="test_host", api_key=API_KEY)
+
+
+@pytest.fixture
+def client(_prototype: CVec) -> CVec:
+    """A CVec client built against a dummy host with a valid-format API key.
+
+    Each test gets a shallow copy of the session prototype with its own HTTP
+    cache, so stubbing methods or caching responses does not leak between tests.
+    """
+    client = copy.copy(_prototype)
+    client._cache = {}
+    return client
+
+
+@pytest.fixture
+def stub_request(monkeypatch: pytest.MonkeyPatch) -> RequestStub:
+    """Install a RequestRecorder returning a response as a client's _make_request."""
+
+    def install(client: CVec, response: Any) -> RequestRecorder:
+        recorder = RequestRecorder(response)
+        monkeypatch.setattr(client, "_make_request", recorder)
+        return recorder
+
+    return install
+
+
+@pytest.fixture
+def stub_rpc(monkeypatch: pytest.MonkeyPatch) -> RPCStub:
+    """Install an RPCRecorder returning a response as a client's _call_rpc."""
+
+    def install(client: CVec, response: Any) -> RPCRecorder:
+        recorder = RPCRecorder(response)
+        monkeypatch.setattr(client, "_call_rpc", recorder)
+        return recorder
+
+    return install
+
+
+@pytest.fixture
+def stub_query_table(monkeypatch: pytest.MonkeyPatch) -> QueryTableStub:
+    """Install a QueryTableRecorder serving rows as a client's _query_table."""
+
+    def install(
+        client: CVec, rows_by_table: Mapping[str, Sequence[Any]]
+    ) -> QueryTableRecorder:
+        recorder = QueryTableRecorder(rows_by_table)
+        monkeypatch.setattr(client, "_query_table", recorder)
+        return recorder
+
+    return install
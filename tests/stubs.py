@@ -0,0 +1,102 @@
+"""Lightweight stand-ins shared by the tests."""
+
+from collections.abc import Callable, Mapping, Sequence
+from types import TracebackType
+from typing import Any
+
+from cvec import CVec
+
+# A well-formed API key (cva_ + 36 symbols) for clients built in tests.
+API_KEY = "cva_hHs0CbkKALxMnxUdI9hanF0TBPvvvr1HjG6O"
+
+
+class StaticResponse:
+    """Minimal urlopen response that always serves the same body."""
+
+    def __init__(self, body: bytes, headers: dict[str, str]) -> None:
+        self.body = body
+        self.headers = headers
+
+    def read(self) -> bytes:
+        return self.body
+
+    def __enter__(self) -> "StaticResponse":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        return None
+
+
+class RequestRecorder:
+    """Stand-in for _make_request that records the last call and returns a response."""
+
+    __slots__ = ("method", "endpoint", "params", "response")
+
+    def __init__(self, response: Any) -> None:
+        self.response = response
+        self.method: str | None = None
+        self.endpoint: str | None = None
+        self.params: dict[str, Any] = {}
+
+    def __call__(
+        self,
+        method: str,
+        endpoint: str,
+        params: dict[str, Any] | None = None,
+        json_data: dict[str, Any] | None = None,
+        data: bytes | None = None,
+        headers: dict[str, str] | None = None,
+    ) -> Any:
+        self.method = method
+        self.endpoint = endpoint
+        self.params = params or {}
+        return self.response
+
+
+class RPCRecorder:
+    """Stand-in for _call_rpc that records the last call and returns a response."""
+
+    __slots__ = ("name", "params", "response")
+
+    def __init__(self, response: Any) -> None:
+        self.response = response
+        self.name: str | None = None
+        self.params: dict[str, Any] = {}
+
+    def __call__(self, function_name: str, params: dict[str, Any] | None = None) -> Any:
+        self.name = function_name
+        self.params = params or {}
+        return self.response
+
+
+class QueryTableRecorder:
+    """Stand-in for _query_table that serves rows by table name and records the call.
+
+    Tables missing from ``rows_by_table`` come back empty, like an unknown
+    PostgREST filter match.
+    """
+
+    __slots__ = ("table_name", "query_params", "rows_by_table")
+
+    def __init__(self, rows_by_table: Mapping[str, Sequence[Any]]) -> None:
+        self.rows_by_table = rows_by_table
+        self.table_name: str | None = None
+        self.query_params: dict[str, str] = {}
+
+    def __call__(
+        self, table_name: str, query_params: dict[str, str] | None = None
+    ) -> Any:
+        self.table_name = table_name
+        self.query_params = query_params or {}
+        return list(self.rows_by_table.get(table_name, ()))
+
+
+# Signatures of the conftest fixtures that install the recorders on a client.
+RequestStub = Callable[[CVec, Any], RequestRecorder]
+RPCStub = Callable[[CVec, Any], RPCRecorder]
+QueryTableStub = Callable[[CVec, Mapping[str, Sequence[Any]]], QueryTableRecorder]
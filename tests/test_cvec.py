@@ -1,571 +1,422 @@
-import io
-import os
+import re
 import socket
 import threading
 import time
 from datetime import datetime
 from typing import Any
-from unittest.mock import patch
 
-import pyarrow as pa  # type: ignore[import-untyped]
-import pyarrow.ipc as ipc  # type: ignore[import-untyped]
 import pytest
 
 from cvec import CVec, EAVFilter
 from cvec.models.metric import Metric
-
-
-def mock_fetch_config_side_effect(instance: CVec) -> str:
-    """Side effect for _fetch_config mock that sets tenant_id."""
-    instance._tenant_id = 1
-    return "test_publishable_key"
+from tests.stubs import API_KEY, QueryTableStub, RequestStub, RPCStub
+
+_API_KEY_ALT = "cva_differentKeyKALxMnxUdI9hanF0TBPvvvr1"
+
+# Expected error messages, compiled once for pytest.raises(match=...).
+_ERR_MISSING_HOST = re.compile(
+    "CVEC_HOST must be set either as an argument or environment variable"
+)
+_ERR_MISSING_API_KEY = re.compile(
+    "CVEC_API_KEY must be set either as an argument or environment variable"
+)
+_ERR_API_KEY_PREFIX = re.compile("API key must start with 'cva_'")
+_ERR_API_KEY_LENGTH = re.compile(
+    re.escape("API key invalid length. Expected cva_ + 36 symbols.")
+)
+_ERR_NO_COLUMN_IDENTIFIER = re.compile("Either column_name or column_id")
+_ERR_BOTH_COLUMN_IDENTIFIERS = re.compile("Only one of column_name or column_id")
+_ERR_TABLE_NOT_FOUND = re.compile("Table 'Unknown Table' not found")
+_ERR_COLUMN_NOT_FOUND = re.compile(
+    "Column 'Unknown Column' not found in table 'Test Table'"
+)
+_ERR_FILTER_NEEDS_COLUMN_ID = re.compile(
+    "Filters for select_from_eav_id must use column_id"
+)
+
+# Hourly sample timestamps shared by the span and metric-data fixtures.
+_T1 = datetime(2023, 1, 1, 10, 0, 0)
+_T2 = datetime(2023, 1, 1, 11, 0, 0)
+_T3 = datetime(2023, 1, 1, 12, 0, 0)
+
+# Simulated backend responses for the span and metric-data getters.
+_SPANS_RESPONSE = (
+    {"name": "test_tag", "value": 30.0, "raw_start_at": _T3, "raw_end_at": None},
+    {"name": "test_tag", "value": "val2", "raw_start_at": _T2, "raw_end_at": _T3},
+    {"name": "test_tag", "value": 10.0, "raw_start_at": _T1, "raw_end_at": _T2},
+)
+_METRIC_DATA_RESPONSE = (
+    {"name": "tag1", "time": _T1, "value_double": 10.0, "value_string": None},
+    {"name": "tag1", "time": _T2, "value_double": 20.0, "value_string": None},
+    {"name": "tag2", "time": _T3, "value_double": None, "value_string": "val_str"},
+)
+
+
+_CVEC_ENV_KEYS = ("CVEC_HOST", "CVEC_API_KEY")
+
+
+def _set_cvec_env(monkeypatch: pytest.MonkeyPatch, values: dict[str, str]) -> None:
+    """Set the CVEC_* environment variables to exactly ``values`` for the test."""
+    for key in _CVEC_ENV_KEYS:
+        monkeypatch.delenv(key, raising=False)
+    for key, value in values.items():
+        monkeypatch.setenv(key, value)
+
+
+_JAN_1 = datetime(2023, 1, 1, 0, 0, 0)
+_JAN_2 = datetime(2023, 1, 2, 0, 0, 0)
+_ENV_SETTINGS = {"CVEC_HOST": "env_host", "CVEC_API_KEY": API_KEY}
+
+# (constructor kwargs, CVEC_* environment, expected client attributes)
+_CONSTRUCTOR_CASES = [
+    pytest.param(
+        {
+            "host": "https://test_host",
+            "default_start_at": _JAN_1,
+            "default_end_at": _JAN_2,
+            "api_key": API_KEY,
+        },
+        {},
+        {
+            "host": "https://test_host",
+            "default_start_at": _JAN_1,
+            "default_end_at": _JAN_2,
+            "_publishable_key": "test_publishable_key",
+            "_api_key": API_KEY,
+        },
+        id="arguments",
+    ),
+    pytest.param(
+        {"host": "example.cvector.dev", "api_key": API_KEY},
+        {},
+        {"host": "https://example.cvector.dev"},
+        id="adds_https",
+    ),
+    pytest.param(
+        {"host": "https://example.cvector.dev", "api_key": API_KEY},
+        {},
+        {"host": "https://example.cvector.dev"},
+        id="preserves_https",
+    ),
+    pytest.param(
+        {"host": "http://localhost:3000", "api_key": API_KEY},
+        {},
+        {"host": "http://localhost:3000"},
+        id="preserves_http",
+    ),
+    pytest.param(
+        {"default_start_at": _JAN_1, "default_end_at": _JAN_2},
+        _ENV_SETTINGS,
+        {
+            "host": "https://env_host",
+            "default_start_at": _JAN_1,
+            "default_end_at": _JAN_2,
+            "_publishable_key": "test_publishable_key",
+            "_api_key": API_KEY,
+        },
+        id="env_vars",
+    ),
+    pytest.param(
+        {
+            "host": "arg_host",
+            "default_start_at": _JAN_1,
+            "default_end_at": _JAN_2,
+            "api_key": _API_KEY_ALT,
+        },
+        _ENV_SETTINGS,
+        {
+            "host": "https://arg_host",
+            "default_start_at": _JAN_1,
+            "default_end_at": _JAN_2,
+            "_api_key": _API_KEY_ALT,
+        },
+        id="args_override_env_vars",
+    ),
+]
 
 
 class TestCVecConstructor:
-    @patch.object(CVec, "_login_with_supabase", return_value=None)
-    @patch.object(
-        CVec, "_fetch_config", autospec=True, side_effect=mock_fetch_config_side_effect
-    )
-    def test_constructor_with_arguments(
-        self, mock_fetch_key: Any, mock_login: Any
-    ) -> None:
-        """Test CVec constructor with all arguments provided."""
-        client = CVec(
-            host="https://test_host",
-            default_start_at=datetime(2023, 1, 1, 0, 0, 0),
-            default_end_at=datetime(2023, 1, 2, 0, 0, 0),
-            api_key="cva_hHs0CbkKALxMnxUdI9hanF0TBPvvvr1HjG6O",
-        )
-        assert client.host == "https://test_host"
-        assert client.default_start_at == datetime(2023, 1, 1, 0, 0, 0)
-        assert client.default_end_at == datetime(2023, 1, 2, 0, 0, 0)
-        assert client._publishable_key == "test_publishable_key"
-        assert client._api_key == "cva_hHs0CbkKALxMnxUdI9hanF0TBPvvvr1HjG6O"
-
-    @patch.object(CVec, "_login_with_supabase", return_value=None)
-    @patch.object(
-        CVec, "_fetch_config", autospec=True, side_effect=mock_fetch_config_side_effect
-    )
-    def test_constructor_adds_https_scheme(
-        self, mock_fetch_key: Any, mock_login: Any
-    ) -> None:
-        """Test CVec constructor adds https:// scheme if not provided."""
-        client = CVec(
-            host="example.cvector.dev",
-            api_key="cva_hHs0CbkKALxMnxUdI9hanF0TBPvvvr1HjG6O",
-        )
-        assert client.host == "https://example.cvector.dev"
-
-    @patch.object(CVec, "_login_with_supabase", return_value=None)
-    @patch.object(
-        CVec, "_fetch_config", autospec=True, side_effect=mock_fetch_config_side_effect
-    )
-    def test_constructor_preserves_https_scheme(
-        self, mock_fetch_key: Any, mock_login: Any
-    ) -> None:
-        """Test CVec constructor preserves https:// scheme if already provided."""
-        client = CVec(
-            host="https://example.cvector.dev",
-            api_key="cva_hHs0CbkKALxMnxUdI9hanF0TBPvvvr1HjG6O",
-        )
-        assert client.host == "https://example.cvector.dev"
-
-    @patch.object(CVec, "_login_with_supabase", return_value=None)
-    @patch.object(
-        CVec, "_fetch_config", autospec=True, side_effect=mock_fetch_config_side_effect
-    )
-    def test_constructor_preserves_http_scheme(
-        self, mock_fetch_key: Any, mock_login: Any
+    @pytest.mark.parametrize(("kwargs", "env", "expected"), _CONSTRUCTOR_CASES)
+    def test_constructor(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+        kwargs: dict[str, Any],
+        env: dict[str, str],
+        expected: dict[str, Any],
     ) -> None:
-        """Test CVec constructor preserves http:// scheme if provided."""
-        client = CVec(
-            host="http://localhost:3000",
-            api_key="cva_hHs0CbkKALxMnxUdI9hanF0TBPvvvr1HjG6O",
-        )
-        assert client.host == "http://localhost:3000"
-
-    @patch.object(CVec, "_login_with_supabase", return_value=None)
-    @patch.object(
-        CVec, "_fetch_config", autospec=True, side_effect=mock_fetch_config_side_effect
-    )
-    @patch.dict(
-        os.environ,
-        {
-            "CVEC_HOST": "env_host",
-            "CVEC_API_KEY": "cva_hHs0CbkKALxMnxUdI9hanF0TBPvvvr1HjG6O",
-        },
-        clear=True,
-    )
-    def test_constructor_with_env_vars(
-        self, mock_fetch_key: Any, mock_login: Any
-    ) -> None:
-        """Test CVec constructor with environment variables."""
-        client = CVec(
-            default_start_at=datetime(2023, 2, 1, 0, 0, 0),
-            default_end_at=datetime(2023, 2, 2, 0, 0, 0),
-        )
-        assert client.host == "https://env_host"
-        assert client._publishable_key == "test_publishable_key"
-        assert client._api_key == "cva_hHs0CbkKALxMnxUdI9hanF0TBPvvvr1HjG6O"
-        assert client.default_start_at == datetime(2023, 2, 1, 0, 0, 0)
-        assert client.default_end_at == datetime(2023, 2, 2, 0, 0, 0)
-
-    @patch.object(CVec, "_login_with_supabase", return_value=None)
-    @patch.object(
-        CVec, "_fetch_config", autospec=True, side_effect=mock_fetch_config_side_effect
-    )
-    @patch.dict(os.environ, {}, clear=True)
-    def test_constructor_missing_host_raises_value_error(
-        self, mock_fetch_key: Any, mock_login: Any
+        """Test CVec constructor resolves settings from arguments and environment."""
+        _set_cvec_env(monkeypatch, env)
+        client = CVec(**kwargs)
+        assert {attr: getattr(client, attr) for attr in expected} == expected
+
+    @pytest.mark.parametrize(
+        ("kwargs", "message"),
+        [
+            ({"api_key": API_KEY}, _ERR_MISSING_HOST),
+            ({"host": "test_host"}, _ERR_MISSING_API_KEY),
+        ],
+        ids=["missing_host", "missing_api_key"],
+    )
+    def test_constructor_missing_setting_raises_value_error(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+        kwargs: dict[str, Any],
+        message: re.Pattern[str],
     ) -> None:
-        """Test CVec constructor raises ValueError if host is missing."""
-        with pytest.raises(
-            ValueError,
-            match="CVEC_HOST must be set either as an argument or environment variable",
-        ):
-            CVec(api_key="cva_hHs0CbkKALxMnxUdI9hanF0TBPvvvr1HjG6O")
-
-    @patch.object(CVec, "_login_with_supabase", return_value=None)
-    @patch.object(
-        CVec, "_fetch_config", autospec=True, side_effect=mock_fetch_config_side_effect
-    )
-    @patch.dict(os.environ, {}, clear=True)
-    def test_constructor_missing_api_key_raises_value_error(
-        self, mock_fetch_key: Any, mock_login: Any
-    ) -> None:
-        """Test CVec constructor raises ValueError if api_key is missing."""
-        with pytest.raises(
-            ValueError,
-            match="CVEC_API_KEY must be set either as an argument or environment variable",
-        ):
-            CVec(host="test_host")
-
-    @patch.object(CVec, "_login_with_supabase", return_value=None)
-    @patch.object(
-        CVec, "_fetch_config", autospec=True, side_effect=mock_fetch_config_side_effect
-    )
-    def test_constructor_args_override_env_vars(
-        self, mock_fetch_key: Any, mock_login: Any
-    ) -> None:
-        """Test CVec constructor arguments override environment variables."""
-        with patch.dict(
-            os.environ,
-            {
-                "CVEC_HOST": "env_host",
-                "CVEC_API_KEY": "cva_hHs0CbkKALxMnxUdI9hanF0TBPvvvr1HjG6O",
-            },
-            clear=True,
-        ):
-            client = CVec(
-                host="arg_host",
-                default_start_at=datetime(2023, 3, 1, 0, 0, 0),
-                default_end_at=datetime(2023, 3, 2, 0, 0, 0),
-                api_key="cva_differentKeyKALxMnxUdI9hanF0TBPvvvr1",
-            )
-            assert client.host == "https://arg_host"
-            assert client._api_key == "cva_differentKeyKALxMnxUdI9hanF0TBPvvvr1"
-            assert client.default_start_at == datetime(2023, 3, 1, 0, 0, 0)
-            assert client.default_end_at == datetime(2023, 3, 2, 0, 0, 0)
-
-    @patch.object(CVec, "_login_with_supabase", return_value=None)
-    @patch.object(
-        CVec, "_fetch_config", autospec=True, side_effect=mock_fetch_config_side_effect
+        """Test CVec constructor raises ValueError if host or api_key is missing."""
+        _set_cvec_env(monkeypatch, {})
+        with pytest.raises(ValueError, match=message):
+            CVec(**kwargs)
+
+    @pytest.mark.parametrize(
+        ("api_key", "expected_email", "message"),
+        [
+            (API_KEY, "cva+hHs0@cvector.app", None),
+            ("invalid_key", None, _ERR_API_KEY_PREFIX),
+            ("cva_short", None, _ERR_API_KEY_LENGTH),
+        ],
+        ids=["valid", "invalid_format", "invalid_length"],
     )
     def test_construct_email_from_api_key(
-        self, mock_fetch_key: Any, mock_login: Any
+        self,
+        client: CVec,
+        api_key: str,
+        expected_email: str | None,
+        message: re.Pattern[str] | None,
     ) -> None:
-        """Test email construction from API key."""
-        client = CVec(
-            host="test_host",
-            api_key="cva_hHs0CbkKALxMnxUdI9hanF0TBPvvvr1HjG6O",
-        )
-        email = client._construct_email_from_api_key()
-        assert email == "cva+hHs0@cvector.app"
-
-    @patch.object(CVec, "_login_with_supabase", return_value=None)
-    @patch.object(
-        CVec, "_fetch_config", autospec=True, side_effect=mock_fetch_config_side_effect
-    )
-    def test_construct_email_from_api_key_invalid_format(
-        self, mock_fetch_key: Any, mock_login: Any
-    ) -> None:
-        """Test email construction with invalid API key format."""
-        client = CVec(
-            host="test_host",
-            api_key="cva_hHs0CbkKALxMnxUdI9hanF0TBPvvvr1HjG6O",
-        )
-        client._api_key = "invalid_key"
-        with pytest.raises(ValueError, match="API key must start with 'cva_'"):
-            client._construct_email_from_api_key()
-
-    @patch.object(CVec, "_login_with_supabase", return_value=None)
-    @patch.object(
-        CVec, "_fetch_config", autospec=True, side_effect=mock_fetch_config_side_effect
-    )
-    def test_construct_email_from_api_key_invalid_length(
-        self, mock_fetch_key: Any, mock_login: Any
-    ) -> None:
-        """Test email construction with invalid API key length."""
-        client = CVec(
-            host="test_host",
-            api_key="cva_hHs0CbkKALxMnxUdI9hanF0TBPvvvr1HjG6O",
-        )
-        client._api_key = "cva_short"
-        with pytest.raises(
-            ValueError, match="API key invalid length. Expected cva_ \\+ 36 symbols."
-        ):
-            client._construct_email_from_api_key()
+        """Test email construction from API key, including malformed keys."""
+        client._api_key = api_key
+        if message is None:
+            assert client._construct_email_from_api_key() == expected_email
+        else:
+            with pytest.raises(ValueError, match=message):
+                client._construct_email_from_api_key()
 
 
 class TestCVecGetSpans:
-    @patch.object(CVec, "_login_with_supabase", return_value=None)
-    @patch.object(
-        CVec, "_fetch_config", autospec=True, side_effect=mock_fetch_config_side_effect
-    )
-    def test_get_spans_basic_case(self, mock_fetch_key: Any, mock_login: Any) -> None:
-        # Simulate backend response
-        response_data = [
-            {
-                "name": "test_tag",
-                "value": 30.0,
-                "raw_start_at": datetime(2023, 1, 1, 12, 0, 0),
-                "raw_end_at": None,
-            },
-            {
-                "name": "test_tag",
-                "value": "val2",
-                "raw_start_at": datetime(2023, 1, 1, 11, 0, 0),
-                "raw_end_at": datetime(2023, 1, 1, 12, 0, 0),
-            },
-            {
-                "name": "test_tag",
-                "value": 10.0,
-                "raw_start_at": datetime(2023, 1, 1, 10, 0, 0),
-                "raw_end_at": datetime(2023, 1, 1, 11, 0, 0),
-            },
-        ]
-        client = CVec(
-            host="test_host",
-            api_key="cva_hHs0CbkKALxMnxUdI9hanF0TBPvvvr1HjG6O",
-        )
-        client._make_request = lambda *args, **kwargs: response_data  # type: ignore[method-assign]
-        spans = client.get_spans(name="test_tag")
+    @pytest.mark.parametrize(
+        ("kwargs", "expected_params"),
+        [
+            ({}, {"start_at": None, "end_at": None, "limit": None}),
+            ({"limit": 2}, {"start_at": None, "end_at": None, "limit": 2}),
+            (
+                {"end_at": datetime(2023, 1, 1, 13, 0, 0)},
+                {"start_at": None, "end_at": "2023-01-01T13:00:00", "limit": None},
+            ),
+        ],
+        ids=["basic_case", "with_limit", "with_end_at"],
+    )
+    def test_get_spans(
+        self,
+        client: CVec,
+        stub_request: RequestStub,
+        kwargs: dict[str, Any],
+        expected_params: dict[str, Any],
+    ) -> None:
+        recorder = stub_request(client, _SPANS_RESPONSE)
+        spans = client.get_spans(name="test_tag", **kwargs)
+        assert recorder.method == "GET"
+        assert recorder.endpoint == "/api/metrics/spans/test_tag"
+        assert recorder.params == expected_params
         assert len(spans) == 3
         assert spans[0].name == "test_tag"
         assert spans[0].value == 30.0
-        assert spans[0].raw_start_at == datetime(2023, 1, 1, 12, 0, 0)
+        assert spans[0].raw_start_at == _T3
         assert spans[0].raw_end_at is None
         assert spans[1].value == "val2"
         assert spans[2].value == 10.0
 
 
-class TestCVecGetMetrics:
-    @patch.object(CVec, "_login_with_supabase", return_value=None)
-    @patch.object(
-        CVec, "_fetch_config", autospec=True, side_effect=mock_fetch_config_side_effect
-    )
-    def test_get_metrics_no_interval(
-        self, mock_fetch_key: Any, mock_login: Any
-    ) -> None:
-        response_data = [
-            {
-                "id": 1,
-                "name": "metric1",
-                "birth_at": datetime(2023, 1, 1, 0, 0, 0),
-                "death_at": datetime(2023, 1, 10, 0, 0, 0),
-            },
-            {
-                "id": 2,
-                "name": "metric2",
-                "birth_at": datetime(2023, 2, 1, 0, 0, 0),
-                "death_at": None,
-            },
-        ]
-        client = CVec(
-            host="test_host",
-            api_key="cva_hHs0CbkKALxMnxUdI9hanF0TBPvvvr1HjG6O",
-        )
-        client._make_request = lambda *args, **kwargs: response_data  # type: ignore[method-assign]
-        metrics = client.get_metrics()
-        assert len(metrics) == 2
-        assert isinstance(metrics[0], Metric)
-        assert metrics[0].id == 1
-        assert metrics[0].name == "metric1"
-        assert metrics[1].id == 2
-        assert metrics[1].name == "metric2"
-
-    @patch.object(CVec, "_login_with_supabase", return_value=None)
-    @patch.object(
-        CVec, "_fetch_config", autospec=True, side_effect=mock_fetch_config_side_effect
-    )
-    def test_get_metrics_with_interval(
-        self, mock_fetch_key: Any, mock_login: Any
-    ) -> None:
-        response_data = [
-            {
-                "id": 1,
-                "name": "metric_in_interval",
-                "birth_at": datetime(2023, 1, 1, 0, 0, 0),
-                "death_at": None,
-            },
-        ]
-        client = CVec(
-            host="test_host",
-            api_key="cva_hHs0CbkKALxMnxUdI9hanF0TBPvvvr1HjG6O",
-        )
-        client._make_request = lambda *args, **kwargs: response_data  # type: ignore[method-assign]
-        metrics = client.get_metrics(
-            start_at=datetime(2023, 1, 5, 0, 0, 0),
-            end_at=datetime(2023, 1, 15, 0, 0, 0),
-        )
-        assert len(metrics) == 1
-        assert metrics[0].name == "metric_in_interval"
+_METRICS_RESPONSE_TWO = (
+    {
+        "id": 1,
+        "name": "metric1",
+        "birth_at": datetime(2023, 1, 1, 0, 0, 0),
+        "death_at": datetime(2023, 1, 10, 0, 0, 0),
+    },
+    {
+        "id": 2,
+        "name": "metric2",
+        "birth_at": datetime(2023, 2, 1, 0, 0, 0),
+        "death_at": None,
+    },
+)
+_METRICS_RESPONSE_IN_INTERVAL = (
+    {
+        "id": 1,
+        "name": "metric_in_interval",
+        "birth_at": datetime(2023, 1, 1, 0, 0, 0),
+        "death_at": None,
+    },
+)
 
-    @patch.object(CVec, "_login_with_supabase", return_value=None)
-    @patch.object(
-        CVec, "_fetch_config", autospec=True, side_effect=mock_fetch_config_side_effect
-    )
-    def test_get_metrics_no_data_found(
-        self, mock_fetch_key: Any, mock_login: Any
+
+class TestCVecGetMetrics:
+    @pytest.mark.parametrize(
+        ("response_data", "kwargs", "expected"),
+        [
+            (_METRICS_RESPONSE_TWO, {}, [(1, "metric1"), (2, "metric2")]),
+            (
+                _METRICS_RESPONSE_IN_INTERVAL,
+                {
+                    "start_at": datetime(2023, 1, 5, 0, 0, 0),
+                    "end_at": datetime(2023, 1, 15, 0, 0, 0),
+                },
+                [(1, "metric_in_interval")],
+            ),
+            (
+                (),
+                {"start_at": datetime(2024, 1, 1), "end_at": datetime(2024, 1, 2)},
+                [],
+            ),
+        ],
+        ids=["no_interval", "with_interval", "no_data_found"],
+    )
+    def test_get_metrics(
+        self,
+        client: CVec,
+        stub_request: RequestStub,
+        response_data: tuple[dict[str, Any], ...],
+        kwargs: dict[str, datetime],
+        expected: list[tuple[int, str]],
     ) -> None:
-        client = CVec(
-            host="test_host",
-            api_key="cva_hHs0CbkKALxMnxUdI9hanF0TBPvvvr1HjG6O",
-        )
-        client._make_request = lambda *args, **kwargs: []  # type: ignore[method-assign]
-        metrics = client.get_metrics(
-            start_at=datetime(2024, 1, 1), end_at=datetime(2024, 1, 2)
-        )
-        assert len(metrics) == 0
+        stub_request(client, response_data)
+        metrics = client.get_metrics(**kwargs)
+        assert all(isinstance(metric, Metric) for metric in metrics)
+        assert [(metric.id, metric.name) for metric in metrics] == expected
 
 
 class TestCVecGetMetricData:
-    @patch.object(CVec, "_login_with_supabase", return_value=None)
-    @patch.object(
-        CVec, "_fetch_config", autospec=True, side_effect=mock_fetch_config_side_effect
-    )
     def test_get_metric_data_basic_case(
-        self, mock_fetch_key: Any, mock_login: Any
+        self, client: CVec, stub_request: RequestStub
     ) -> None:
-        # Simulate backend response
-        time1 = datetime(2023, 1, 1, 10, 0, 0)
-        time2 = datetime(2023, 1, 1, 11, 0, 0)
-        time3 = datetime(2023, 1, 1, 12, 0, 0)
-        response_data = [
-            {"name": "tag1", "time": time1, "value_double": 10.0, "value_string": None},
-            {"name": "tag1", "time": time2, "value_double": 20.0, "value_string": None},
-            {
-                "name": "tag2",
-                "time": time3,
-                "value_double": None,
-                "value_string": "val_str",
-            },
-        ]
-        client = CVec(
-            host="test_host",
-            api_key="cva_hHs0CbkKALxMnxUdI9hanF0TBPvvvr1HjG6O",
-        )
-        client._make_request = lambda *args, **kwargs: response_data  # type: ignore[method-assign]
+        stub_request(client, _METRIC_DATA_RESPONSE)
         data_points = client.get_metric_data(names=["tag1", "tag2"])
         assert len(data_points) == 3
         assert data_points[0].name == "tag1"
-        assert data_points[0].time == time1
+        assert data_points[0].time == _T1
         assert data_points[0].value_double == 10.0
         assert data_points[0].value_string is None
         assert data_points[2].name == "tag2"
-        assert data_points[2].time == time3
+        assert data_points[2].time == _T3
         assert data_points[2].value_double is None
         assert data_points[2].value_string == "val_str"
 
-    @patch.object(CVec, "_login_with_supabase", return_value=None)
-    @patch.object(
-        CVec, "_fetch_config", autospec=True, side_effect=mock_fetch_config_side_effect
-    )
     def test_get_metric_data_no_data_points(
-        self, mock_fetch_key: Any, mock_login: Any
+        self, client: CVec, stub_request: RequestStub
     ) -> None:
-        client = CVec(
-            host="test_host",
-            api_key="cva_hHs0CbkKALxMnxUdI9hanF0TBPvvvr1HjG6O",
-        )
-        client._make_request = lambda *args, **kwargs: []  # type: ignore[method-assign]
+        stub_request(client, [])
         data_points = client.get_metric_data(names=["non_existent_tag"])
         assert data_points == []
 
-    @patch.object(CVec, "_login_with_supabase", return_value=None)
-    @patch.object(
-        CVec, "_fetch_config", autospec=True, side_effect=mock_fetch_config_side_effect
+
+class TestEAVFilter:
+    @pytest.mark.parametrize(
+        ("kwargs", "expected"),
+        [
+            ({"column_name": "Date"}, {"column_name": "Date", "column_id": None}),
+            ({"column_id": "MTnaC"}, {"column_id": "MTnaC", "column_name": None}),
+            (
+                {"column_name": "Date", "numeric_min": 100, "numeric_max": 200},
+                {"column_name": "Date", "numeric_min": 100, "numeric_max": 200},
+            ),
+            (
+                {"column_name": "Status", "string_value": "failure"},
+                {"column_name": "Status", "string_value": "failure"},
+            ),
+            (
+                {"column_name": "Is Active", "boolean_value": False},
+                {"column_name": "Is Active", "boolean_value": False},
+            ),
+        ],
+        ids=["column_name", "column_id", "numeric_range", "string_value", "boolean"],
     )
-    def test_get_metric_arrow_basic_case(
-        self, mock_fetch_key: Any, mock_login: Any
+    def test_eav_filter_valid(
+        self, kwargs: dict[str, Any], expected: dict[str, Any]
     ) -> None:
-        # Prepare Arrow table
-        names = ["tag1", "tag1", "tag2"]
-        times = [
-            datetime(2023, 1, 1, 10, 0, 0),
-            datetime(2023, 1, 1, 11, 0, 0),
-            datetime(2023, 1, 1, 12, 0, 0),
-        ]
-        value_doubles = [10.0, 20.0, None]
-        value_strings = [None, None, "val_str"]
-        table = pa.table(
-            {
-                "name": pa.array(names),
-                "time": pa.array(times, type=pa.timestamp("us", tz=None)),
-                "value_double": pa.array(value_doubles, type=pa.float64()),
-                "value_string": pa.array(value_strings, type=pa.string()),
-            }
-        )
-        sink = pa.BufferOutputStream()
-        with ipc.new_file(sink, table.schema) as writer:
-            writer.write_table(table)
-        arrow_bytes = sink.getvalue().to_pybytes()
-        client = CVec(
-            host="test_host",
-            api_key="cva_hHs0CbkKALxMnxUdI9hanF0TBPvvvr1HjG6O",
-        )
-        client._make_request = lambda *args, **kwargs: arrow_bytes  # type: ignore[method-assign]
-        result = client.get_metric_arrow(names=["tag1", "tag2"])
-        reader = ipc.open_file(io.BytesIO(result))
-        result_table = reader.read_all()
-        assert result_table.num_rows == 3
-        assert result_table.column("name").to_pylist() == names
-        assert result_table.column("value_double").to_pylist() == [10.0, 20.0, None]
-        assert result_table.column("value_string").to_pylist() == [
-            None,
-            None,
-            "val_str",
-        ]
-
-    @patch.object(CVec, "_login_with_supabase", return_value=None)
-    @patch.object(
-        CVec, "_fetch_config", autospec=True, side_effect=mock_fetch_config_side_effect
+        """Test EAVFilter stores the given identifier and value constraints."""
+        filter_obj = EAVFilter(**kwargs)
+        for attr, value in expected.items():
+            actual = getattr(filter_obj, attr)
+            assert actual == value
+            assert type(actual) is type(value)
+
+    @pytest.mark.parametrize(
+        ("kwargs", "message"),
+        [
+            ({"numeric_min": 100}, _ERR_NO_COLUMN_IDENTIFIER),
+            (
+                {"column_name": "Date", "column_id": "MTnaC"},
+                _ERR_BOTH_COLUMN_IDENTIFIERS,
+            ),
+        ],
+        ids=["no_identifier", "both_identifiers"],
     )
-    def test_get_metric_arrow_empty(self, mock_fetch_key: Any, mock_login: Any) -> None:
-        table = pa.table(
-            {
-                "name": pa.array([], type=pa.string()),
-                "time": pa.array([], type=pa.timestamp("us", tz=None)),
-                "value_double": pa.array([], type=pa.float64()),
-                "value_string": pa.array([], type=pa.string()),
-            }
-        )
-        sink = pa.BufferOutputStream()
-        with ipc.new_file(sink, table.schema) as writer:
-            writer.write_table(table)
-        arrow_bytes = sink.getvalue().to_pybytes()
-        client = CVec(
-            host="test_host",
-            api_key="cva_hHs0CbkKALxMnxUdI9hanF0TBPvvvr1HjG6O",
-        )
-        client._make_request = lambda *args, **kwargs: arrow_bytes  # type: ignore[method-assign]
-        result = client.get_metric_arrow(names=["non_existent_tag"])
-        reader = ipc.open_file(io.BytesIO(result))
-        result_table = reader.read_all()
-        assert result_table.num_rows == 0
-        assert result_table.column("name").to_pylist() == []
-        assert result_table.column("value_double").to_pylist() == []
-        assert result_table.column("value_string").to_pylist() == []
-
-
-class TestEAVFilter:
-    def test_eav_filter_with_column_name(self) -> None:
-        """Test EAVFilter with column_name."""
-        filter_obj = EAVFilter(column_name="Date")
-        assert filter_obj.column_name == "Date"
-        assert filter_obj.column_id is None
-
-    def test_eav_filter_with_column_id(self) -> None:
-        """Test EAVFilter with column_id."""
-        filter_obj = EAVFilter(column_id="MTnaC")
-        assert filter_obj.column_id == "MTnaC"
-        assert filter_obj.column_name is None
-
-    def test_eav_filter_numeric_range(self) -> None:
-        """Test EAVFilter with numeric range."""
-        filter_obj = EAVFilter(column_name="Date", numeric_min=100, numeric_max=200)
-        assert filter_obj.column_name == "Date"
-        assert filter_obj.numeric_min == 100
-        assert filter_obj.numeric_max == 200
-
-    def test_eav_filter_string_value(self) -> None:
-        """Test EAVFilter with string value."""
-        filter_obj = EAVFilter(column_name="Status", string_value="failure")
-        assert filter_obj.column_name == "Status"
-        assert filter_obj.string_value == "failure"
-
-    def test_eav_filter_boolean_value(self) -> None:
-        """Test EAVFilter with boolean value."""
-        filter_obj = EAVFilter(column_name="Is Active", boolean_value=False)
-        assert filter_obj.column_name == "Is Active"
-        assert filter_obj.boolean_value is False
-
-    def test_eav_filter_requires_column_identifier(self) -> None:
-        """Test EAVFilter raises error when neither column_name nor column_id."""
-        with pytest.raises(ValueError, match="Either column_name or column_id"):
-            EAVFilter(numeric_min=100)
-
-    def test_eav_filter_rejects_both_identifiers(self) -> None:
-        """Test EAVFilter raises error when both column_name and column_id."""
-        with pytest.raises(ValueError, match="Only one of column_name or column_id"):
-            EAVFilter(column_name="Date", column_id="MTnaC")
+    def test_eav_filter_invalid(
+        self, kwargs: dict[str, Any], message: re.Pattern[str]
+    ) -> None:
+        """Test EAVFilter requires exactly one of column_name or column_id."""
+        with pytest.raises(ValueError, match=message):
+            EAVFilter(**kwargs)
+
+
+_EAV_TABLE_ID = "7a80f3a2-6fa1-43ce-8483-76bd00dc93c6"
+_EAV_TABLE_ROWS = ({"id": _EAV_TABLE_ID, "tenant_id": 1, "name": "Test Table"},)
+_EAV_COLUMN_ROWS = (
+    {
+        "eav_table_id": _EAV_TABLE_ID,
+        "eav_column_id": "col1_id",
+        "name": "Column 1",
+        "type": "number",
+    },
+    {
+        "eav_table_id": _EAV_TABLE_ID,
+        "eav_column_id": "col2_id",
+        "name": "Column 2",
+        "type": "string",
+    },
+    {
+        "eav_table_id": _EAV_TABLE_ID,
+        "eav_column_id": "is_active_id",
+        "name": "Is Active",
+        "type": "boolean",
+    },
+)
+
+# Range and string filters, by column name and by column ID, and the RPC
+# filter payload both forms resolve to.
+_FILTERS_BY_NAME = (
+    EAVFilter(column_name="Column 1", numeric_min=100, numeric_max=200),
+    EAVFilter(column_name="Column 2", string_value="ACTIVE"),
+)
+_FILTERS_BY_ID = (
+    EAVFilter(column_id="col1_id", numeric_min=100, numeric_max=200),
+    EAVFilter(column_id="col2_id", string_value="ACTIVE"),
+)
+_EXPECTED_RPC_FILTERS = (
+    {"column_id": "col1_id", "numeric_min": 100, "numeric_max": 200},
+    {"column_id": "col2_id", "string_value": "ACTIVE"},
+)
+
+
+# _query_table rows for a tenant with the one test table.
+_EAV_ROWS_BY_TABLE = {"eav_tables": _EAV_TABLE_ROWS, "eav_columns": _EAV_COLUMN_ROWS}
 
 
 class TestCVecSelectFromEAV:
     """Tests for select_from_eav using table_name and column_names."""
 
-    def _mock_query_table(
-        self, table_id: str = "7a80f3a2-6fa1-43ce-8483-76bd00dc93c6"
-    ) -> Any:
-        """Create a mock for _query_table that returns table and column data."""
-
-        def mock_query(
-            table_name: str, query_params: dict[str, str] | None = None
-        ) -> Any:
-            if table_name == "eav_tables":
-                return [{"id": table_id, "tenant_id": 1, "name": "Test Table"}]
-            elif table_name == "eav_columns":
-                return [
-                    {
-                        "eav_table_id": table_id,
-                        "eav_column_id": "col1_id",
-                        "name": "Column 1",
-                        "type": "number",
-                    },
-                    {
-                        "eav_table_id": table_id,
-                        "eav_column_id": "col2_id",
-                        "name": "Column 2",
-                        "type": "string",
-                    },
-                    {
-                        "eav_table_id": table_id,
-                        "eav_column_id": "is_active_id",
-                        "name": "Is Active",
-                        "type": "boolean",
-                    },
-                ]
-            return []
-
-        return mock_query
-
-    @patch.object(CVec, "_login_with_supabase", return_value=None)
-    @patch.object(
-        CVec, "_fetch_config", autospec=True, side_effect=mock_fetch_config_side_effect
-    )
-    def test_select_from_eav_basic(self, mock_fetch_key: Any, mock_login: Any) -> None:
+    def test_select_from_eav_basic(
+        self, client: CVec, stub_query_table: QueryTableStub, stub_rpc: RPCStub
+    ) -> None:
         """Test select_from_eav with no filters."""
         # Response uses column IDs
         rpc_response = [
             {"id": "row1", "col1_id": 100.5, "col2_id": "value1"},
             {"id": "row2", "col1_id": 200.0, "col2_id": "value2"},
         ]
-        client = CVec(
-            host="test_host",
-            api_key="cva_hHs0CbkKALxMnxUdI9hanF0TBPvvvr1HjG6O",
-        )
-        client._query_table = self._mock_query_table()  # type: ignore[method-assign]
-        client._call_rpc = lambda *args, **kwargs: rpc_response  # type: ignore[method-assign]
+        stub_query_table(client, _EAV_ROWS_BY_TABLE)
+        stub_rpc(client, rpc_response)
 
         result = client.select_from_eav(
             table_name="Test Table",
@@ -577,31 +428,17 @@ class TestCVecSelectFromEAV:
         assert result[0]["Column 1"] == 100.5
         assert result[1]["Column 2"] == "value2"
 
-    @patch.object(CVec, "_login_with_supabase", return_value=None)
-    @patch.object(
-        CVec, "_fetch_config", autospec=True, side_effect=mock_fetch_config_side_effect
-    )
     def test_select_from_eav_with_column_names(
-        self, mock_fetch_key: Any, mock_login: Any
+        self, client: CVec, stub_query_table: QueryTableStub, stub_rpc: RPCStub
     ) -> None:
         """Test select_from_eav with specific column_names."""
         rpc_response = [
             {"id": "row1", "col1_id": 100.5},
             {"id": "row2", "col1_id": 200.0},
         ]
-        client = CVec(
-            host="test_host",
-            api_key="cva_hHs0CbkKALxMnxUdI9hanF0TBPvvvr1HjG6O",
-        )
-
-        captured_params: dict[str, Any] = {}
 
-        def mock_call_rpc(name: str, params: Any) -> Any:
-            captured_params.update(params)
-            return rpc_response
-
-        client._query_table = self._mock_query_table()  # type: ignore[method-assign]
-        client._call_rpc = mock_call_rpc  # type: ignore[assignment, method-assign]
+        stub_query_table(client, _EAV_ROWS_BY_TABLE)
+        spy = stub_rpc(client, rpc_response)
 
         result = client.select_from_eav(
             table_name="Test Table",
@@ -610,75 +447,39 @@ class TestCVecSelectFromEAV:
 
         assert len(result) == 2
         # Should translate column name to column ID for the RPC call
-        assert captured_params["column_ids"] == ["col1_id"]
+        assert spy.params["column_ids"] == ["col1_id"]
 
-    @patch.object(CVec, "_login_with_supabase", return_value=None)
-    @patch.object(
-        CVec, "_fetch_config", autospec=True, side_effect=mock_fetch_config_side_effect
-    )
     def test_select_from_eav_with_filters(
-        self, mock_fetch_key: Any, mock_login: Any
+        self, client: CVec, stub_query_table: QueryTableStub, stub_rpc: RPCStub
     ) -> None:
         """Test select_from_eav with filters."""
         rpc_response = [
             {"id": "row1", "col1_id": 150.0, "col2_id": "ACTIVE"},
         ]
-        client = CVec(
-            host="test_host",
-            api_key="cva_hHs0CbkKALxMnxUdI9hanF0TBPvvvr1HjG6O",
-        )
-
-        captured_params: dict[str, Any] = {}
 
-        def mock_call_rpc(name: str, params: Any) -> Any:
-            captured_params.update(params)
-            return rpc_response
-
-        client._query_table = self._mock_query_table()  # type: ignore[method-assign]
-        client._call_rpc = mock_call_rpc  # type: ignore[assignment, method-assign]
-
-        filters = [
-            EAVFilter(column_name="Column 1", numeric_min=100, numeric_max=200),
-            EAVFilter(column_name="Column 2", string_value="ACTIVE"),
-        ]
+        stub_query_table(client, _EAV_ROWS_BY_TABLE)
+        spy = stub_rpc(client, rpc_response)
 
         result = client.select_from_eav(
             table_name="Test Table",
-            filters=filters,
+            filters=list(_FILTERS_BY_NAME),
         )
 
         assert len(result) == 1
         assert result[0]["Column 1"] == 150.0
         # Filters should use column IDs in RPC call
-        assert captured_params["filters"] == [
-            {"column_id": "col1_id", "numeric_min": 100, "numeric_max": 200},
-            {"column_id": "col2_id", "string_value": "ACTIVE"},
-        ]
+        assert spy.params["filters"] == list(_EXPECTED_RPC_FILTERS)
 
-    @patch.object(CVec, "_login_with_supabase", return_value=None)
-    @patch.object(
-        CVec, "_fetch_config", autospec=True, side_effect=mock_fetch_config_side_effect
-    )
     def test_select_from_eav_with_boolean_filter(
-        self, mock_fetch_key: Any, mock_login: Any
+        self, client: CVec, stub_query_table: QueryTableStub, stub_rpc: RPCStub
     ) -> None:
         """Test select_from_eav with boolean filter."""
         rpc_response = [
             {"id": "row1", "is_active_id": True},
         ]
-        client = CVec(
-            host="test_host",
-            api_key="cva_hHs0CbkKALxMnxUdI9hanF0TBPvvvr1HjG6O",
-        )
 
-        captured_params: dict[str, Any] = {}
-
-        def mock_call_rpc(name: str, params: Any) -> Any:
-            captured_params.update(params)
-            return rpc_response
-
-        client._query_table = self._mock_query_table()  # type: ignore[method-assign]
-        client._call_rpc = mock_call_rpc  # type: ignore[assignment, method-assign]
+        stub_query_table(client, _EAV_ROWS_BY_TABLE)
+        spy = stub_rpc(client, rpc_response)
 
         filters = [EAVFilter(column_name="Is Active", boolean_value=True)]
 
@@ -688,24 +489,16 @@ class TestCVecSelectFromEAV:
         )
 
         assert len(result) == 1
-        assert captured_params["filters"] == [
+        assert spy.params["filters"] == [
             {"column_id": "is_active_id", "boolean_value": True}
         ]
 
-    @patch.object(CVec, "_login_with_supabase", return_value=None)
-    @patch.object(
-        CVec, "_fetch_config", autospec=True, side_effect=mock_fetch_config_side_effect
-    )
     def test_select_from_eav_empty_result(
-        self, mock_fetch_key: Any, mock_login: Any
+        self, client: CVec, stub_query_table: QueryTableStub, stub_rpc: RPCStub
     ) -> None:
         """Test select_from_eav with empty result."""
-        client = CVec(
-            host="test_host",
-            api_key="cva_hHs0CbkKALxMnxUdI9hanF0TBPvvvr1HjG6O",
-        )
-        client._query_table = self._mock_query_table()  # type: ignore[method-assign]
-        client._call_rpc = lambda *args, **kwargs: []  # type: ignore[method-assign]
+        stub_query_table(client, _EAV_ROWS_BY_TABLE)
+        stub_rpc(client, [])
 
         result = client.select_from_eav(
             table_name="Test Table",
@@ -713,42 +506,24 @@ class TestCVecSelectFromEAV:
 
         assert result == []
 
-    @patch.object(CVec, "_login_with_supabase", return_value=None)
-    @patch.object(
-        CVec, "_fetch_config", autospec=True, side_effect=mock_fetch_config_side_effect
-    )
     def test_select_from_eav_table_not_found(
-        self, mock_fetch_key: Any, mock_login: Any
+        self, client: CVec, stub_query_table: QueryTableStub
     ) -> None:
         """Test select_from_eav raises error when table not found."""
-        client = CVec(
-            host="test_host",
-            api_key="cva_hHs0CbkKALxMnxUdI9hanF0TBPvvvr1HjG6O",
-        )
-        client._query_table = lambda *args, **kwargs: []  # type: ignore[method-assign]
+        stub_query_table(client, {})
 
-        with pytest.raises(ValueError, match="Table 'Unknown Table' not found"):
+        with pytest.raises(ValueError, match=_ERR_TABLE_NOT_FOUND):
             client.select_from_eav(
                 table_name="Unknown Table",
             )
 
-    @patch.object(CVec, "_login_with_supabase", return_value=None)
-    @patch.object(
-        CVec, "_fetch_config", autospec=True, side_effect=mock_fetch_config_side_effect
-    )
     def test_select_from_eav_column_not_found(
-        self, mock_fetch_key: Any, mock_login: Any
+        self, client: CVec, stub_query_table: QueryTableStub
     ) -> None:
         """Test select_from_eav raises error when column not found."""
-        client = CVec(
-            host="test_host",
-            api_key="cva_hHs0CbkKALxMnxUdI9hanF0TBPvvvr1HjG6O",
-        )
-        client._query_table = self._mock_query_table()  # type: ignore[method-assign]
+        stub_query_table(client, _EAV_ROWS_BY_TABLE)
 
-        with pytest.raises(
-            ValueError, match="Column 'Unknown Column' not found in table 'Test Table'"
-        ):
+        with pytest.raises(ValueError, match=_ERR_COLUMN_NOT_FOUND):
             client.select_from_eav(
                 table_name="Test Table",
                 column_names=["Unknown Column"],
@@ -758,26 +533,16 @@ class TestCVecSelectFromEAV:
 class TestCVecSelectFromEAVId:
     """Tests for select_from_eav_id using table_id and column_ids directly."""
 
-    @patch.object(CVec, "_login_with_supabase", return_value=None)
-    @patch.object(
-        CVec, "_fetch_config", autospec=True, side_effect=mock_fetch_config_side_effect
-    )
-    def test_select_from_eav_id_basic(
-        self, mock_fetch_key: Any, mock_login: Any
-    ) -> None:
+    def test_select_from_eav_id_basic(self, client: CVec, stub_rpc: RPCStub) -> None:
         """Test select_from_eav_id with no filters."""
         rpc_response = [
             {"id": "row1", "col1_id": 100.5, "col2_id": "value1"},
             {"id": "row2", "col1_id": 200.0, "col2_id": "value2"},
         ]
-        client = CVec(
-            host="test_host",
-            api_key="cva_hHs0CbkKALxMnxUdI9hanF0TBPvvvr1HjG6O",
-        )
-        client._call_rpc = lambda *args, **kwargs: rpc_response  # type: ignore[method-assign]
+        stub_rpc(client, rpc_response)
 
         result = client.select_from_eav_id(
-            table_id="7a80f3a2-6fa1-43ce-8483-76bd00dc93c6",
+            table_id=_EAV_TABLE_ID,
         )
 
         # Result keeps column IDs (no name translation)
@@ -786,117 +551,61 @@ class TestCVecSelectFromEAVId:
         assert result[0]["col1_id"] == 100.5
         assert result[1]["col2_id"] == "value2"
 
-    @patch.object(CVec, "_login_with_supabase", return_value=None)
-    @patch.object(
-        CVec, "_fetch_config", autospec=True, side_effect=mock_fetch_config_side_effect
-    )
     def test_select_from_eav_id_with_column_ids(
-        self, mock_fetch_key: Any, mock_login: Any
+        self, client: CVec, stub_rpc: RPCStub
     ) -> None:
         """Test select_from_eav_id with specific column_ids."""
         rpc_response = [
             {"id": "row1", "col1_id": 100.5},
         ]
-        client = CVec(
-            host="test_host",
-            api_key="cva_hHs0CbkKALxMnxUdI9hanF0TBPvvvr1HjG6O",
-        )
-
-        captured_params: dict[str, Any] = {}
-
-        def mock_call_rpc(name: str, params: Any) -> Any:
-            captured_params.update(params)
-            return rpc_response
 
-        client._call_rpc = mock_call_rpc  # type: ignore[assignment, method-assign]
+        spy = stub_rpc(client, rpc_response)
 
         result = client.select_from_eav_id(
-            table_id="7a80f3a2-6fa1-43ce-8483-76bd00dc93c6",
+            table_id=_EAV_TABLE_ID,
             column_ids=["col1_id"],
         )
 
         assert len(result) == 1
-        assert captured_params["column_ids"] == ["col1_id"]
+        assert spy.params["column_ids"] == ["col1_id"]
 
-    @patch.object(CVec, "_login_with_supabase", return_value=None)
-    @patch.object(
-        CVec, "_fetch_config", autospec=True, side_effect=mock_fetch_config_side_effect
-    )
     def test_select_from_eav_id_with_filters(
-        self, mock_fetch_key: Any, mock_login: Any
+        self, client: CVec, stub_rpc: RPCStub
     ) -> None:
         """Test select_from_eav_id with filters using column_id."""
         rpc_response = [
             {"id": "row1", "col1_id": 150.0, "col2_id": "ACTIVE"},
         ]
-        client = CVec(
-            host="test_host",
-            api_key="cva_hHs0CbkKALxMnxUdI9hanF0TBPvvvr1HjG6O",
-        )
-
-        captured_params: dict[str, Any] = {}
-
-        def mock_call_rpc(name: str, params: Any) -> Any:
-            captured_params.update(params)
-            return rpc_response
 
-        client._call_rpc = mock_call_rpc  # type: ignore[assignment, method-assign]
-
-        filters = [
-            EAVFilter(column_id="col1_id", numeric_min=100, numeric_max=200),
-            EAVFilter(column_id="col2_id", string_value="ACTIVE"),
-        ]
+        spy = stub_rpc(client, rpc_response)
 
         result = client.select_from_eav_id(
-            table_id="7a80f3a2-6fa1-43ce-8483-76bd00dc93c6",
-            filters=filters,
+            table_id=_EAV_TABLE_ID,
+            filters=list(_FILTERS_BY_ID),
         )
 
         assert len(result) == 1
-        assert captured_params["filters"] == [
-            {"column_id": "col1_id", "numeric_min": 100, "numeric_max": 200},
-            {"column_id": "col2_id", "string_value": "ACTIVE"},
-        ]
+        assert spy.params["filters"] == list(_EXPECTED_RPC_FILTERS)
 
-    @patch.object(CVec, "_login_with_supabase", return_value=None)
-    @patch.object(
-        CVec, "_fetch_config", autospec=True, side_effect=mock_fetch_config_side_effect
-    )
-    def test_select_from_eav_id_rejects_column_name_filter(
-        self, mock_fetch_key: Any, mock_login: Any
-    ) -> None:
+    def test_select_from_eav_id_rejects_column_name_filter(self, client: CVec) -> None:
         """Test select_from_eav_id raises error when filter uses column_name."""
-        client = CVec(
-            host="test_host",
-            api_key="cva_hHs0CbkKALxMnxUdI9hanF0TBPvvvr1HjG6O",
-        )
 
         filters = [EAVFilter(column_name="Column 1", numeric_min=100)]
 
-        with pytest.raises(
-            ValueError, match="Filters for select_from_eav_id must use column_id"
-        ):
+        with pytest.raises(ValueError, match=_ERR_FILTER_NEEDS_COLUMN_ID):
             client.select_from_eav_id(
-                table_id="7a80f3a2-6fa1-43ce-8483-76bd00dc93c6",
+                table_id=_EAV_TABLE_ID,
                 filters=filters,
             )
 
-    @patch.object(CVec, "_login_with_supabase", return_value=None)
-    @patch.object(
-        CVec, "_fetch_config", autospec=True, side_effect=mock_fetch_config_side_effect
-    )
     def test_select_from_eav_id_empty_result(
-        self, mock_fetch_key: Any, mock_login: Any
+        self, client: CVec, stub_rpc: RPCStub
     ) -> None:
         """Test select_from_eav_id with empty result."""
-        client = CVec(
-            host="test_host",
-            api_key="cva_hHs0CbkKALxMnxUdI9hanF0TBPvvvr1HjG6O",
-        )
-        client._call_rpc = lambda *args, **kwargs: []  # type: ignore[method-assign]
+        stub_rpc(client, [])
 
         result = client.select_from_eav_id(
-            table_id="7a80f3a2-6fa1-43ce-8483-76bd00dc93c6",
+            table_id=_EAV_TABLE_ID,
         )
 
         assert result == []
@@ -905,42 +614,24 @@ class TestCVecSelectFromEAVId:
 class TestCVecTimeout:
     """Test that HTTP requests respect the timeout parameter."""
 
-    @patch.object(CVec, "_login_with_supabase", return_value=None)
-    @patch.object(
-        CVec, "_fetch_config", autospec=True, side_effect=mock_fetch_config_side_effect
-    )
-    def test_default_timeout_is_set(self, mock_fetch_key: Any, mock_login: Any) -> None:
+    def test_default_timeout_is_set(self, client: CVec) -> None:
         """Test that the default timeout is 30 seconds."""
-        client = CVec(
-            host="test_host",
-            api_key="cva_hHs0CbkKALxMnxUdI9hanF0TBPvvvr1HjG6O",
-        )
         assert client.timeout == 30
 
-    @patch.object(CVec, "_login_with_supabase", return_value=None)
-    @patch.object(
-        CVec, "_fetch_config", autospec=True, side_effect=mock_fetch_config_side_effect
-    )
-    def test_custom_timeout_is_set(self, mock_fetch_key: Any, mock_login: Any) -> None:
+    def test_custom_timeout_is_set(self) -> None:
         """Test that a custom timeout can be provided."""
         client = CVec(
             host="test_host",
-            api_key="cva_hHs0CbkKALxMnxUdI9hanF0TBPvvvr1HjG6O",
+            api_key=API_KEY,
             timeout=60,
         )
         assert client.timeout == 60
 
-    @patch.object(CVec, "_login_with_supabase", return_value=None)
-    @patch.object(
-        CVec, "_fetch_config", autospec=True, side_effect=mock_fetch_config_side_effect
-    )
-    def test_none_timeout_disables_timeout(
-        self, mock_fetch_key: Any, mock_login: Any
-    ) -> None:
+    def test_none_timeout_disables_timeout(self) -> None:
         """Test that timeout=None disables the timeout."""
         client = CVec(
             host="test_host",
-            api_key="cva_hHs0CbkKALxMnxUdI9hanF0TBPvvvr1HjG6O",
+            api_key=API_KEY,
             timeout=None,
         )
         assert client.timeout is None
@@ -962,27 +653,18 @@ class TestCVecTimeout:
         t = threading.Thread(target=accept_and_hang, daemon=True)
         t.start()
 
-        with (
-            patch.object(CVec, "_login_with_supabase", return_value=None),
-            patch.object(
-                CVec,
-                "_fetch_config",
-                autospec=True,
-                side_effect=mock_fetch_config_side_effect,
-            ),
-        ):
-            client = CVec(
-                host=f"http://127.0.0.1:{port}",
-                api_key="cva_hHs0CbkKALxMnxUdI9hanF0TBPvvvr1HjG6O",
-                timeout=2,
-            )
-            client._access_token = "fake_token"
+        client = CVec(
+            host=f"http://127.0.0.1:{port}",
+            api_key=API_KEY,
+            timeout=0.5,
+        )
+        client._access_token = "fake_token"
 
-            start = time.time()
-            with pytest.raises(OSError):
-                client._make_request("GET", "/api/test")
-            elapsed = time.time() - start
+        start = time.time()
+        with pytest.raises(OSError):
+            client._make_request("GET", "/api/test")
+        elapsed = time.time() - start
 
-            assert elapsed < 5, f"Expected timeout around 2s, took {elapsed:.1f}s"
+        assert elapsed < 3, f"Expected timeout around 0.5s, took {elapsed:.1f}s"
 
         srv.close()
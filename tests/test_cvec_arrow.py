@@ -0,0 +1,22 @@
+"""Tests for reading metric data in Arrow IPC format."""
+
+from cvec import CVec
+from tests.stubs import RequestStub
+
+
+class TestCVecGetMetricArrow:
+    def test_get_metric_arrow_basic_case(
+        self, client: CVec, stub_request: RequestStub
+    ) -> None:
+        recorder = stub_request(client, b"fake_arrow_data")
+        result = client.get_metric_arrow(names=["tag1", "tag2"])
+        assert result == b"fake_arrow_data"
+        assert recorder.endpoint == "/api/metrics/data/arrow"
+        assert recorder.params["names"] == "tag1,tag2"
+
+    def test_get_metric_arrow_empty(
+        self, client: CVec, stub_request: RequestStub
+    ) -> None:
+        stub_request(client, b"")
+        result = client.get_metric_arrow(names=["non_existent_tag"])
+        assert result == b""
@@ -3,17 +3,12 @@
 import json
 import time
 from typing import Any
-from unittest.mock import Mock, patch
+from unittest.mock import patch
 from urllib.error import HTTPError
 
 from cvec import CVec
 from cvec.http_cache import CacheEntry, parse_max_age
-
-
-def mock_fetch_config_side_effect(instance: CVec) -> str:
-    """Side effect for _fetch_config mock that sets tenant_id."""
-    instance._tenant_id = 1
-    return "test_publishable_key"
+from tests.stubs import API_KEY, StaticResponse
 
 
 def _make_mock_response(
@@ -21,27 +16,21 @@ def _make_mock_response(
     content_type: str = "application/json",
     etag: str = "",
     cache_control: str = "",
-) -> Mock:
+) -> StaticResponse:
     """Create a mock HTTP response."""
-    mock_response = Mock()
-    mock_response.read.return_value = body
-
     headers: dict[str, str] = {"content-type": content_type}
     if etag:
         headers["ETag"] = etag
     if cache_control:
         headers["Cache-Control"] = cache_control
-    mock_response.headers = headers
-    mock_response.__enter__ = Mock(return_value=mock_response)
-    mock_response.__exit__ = Mock(return_value=False)
-    return mock_response
+    return StaticResponse(body, headers)
 
 
 def _create_client() -> CVec:
-    """Create a CVec client with mocked auth."""
+    """Create a CVec client; conftest stubs its config fetch and login."""
     client = CVec(
         host="https://test.example.com",
-        api_key="cva_hHs0CbkKALxMnxUdI9hanF0TBPvvvr1HjG6O",
+        api_key=API_KEY,
     )
     client._access_token = "test_token"
     return client
@@ -93,20 +82,8 @@ class TestCacheEntry:
 class TestHttpCache:
     """Integration tests for caching in _make_request."""
 
-    @patch.object(CVec, "_login_with_supabase", return_value=None)
-    @patch.object(
-        CVec,
-        "_fetch_config",
-        autospec=True,
-        side_effect=mock_fetch_config_side_effect,
-    )
     @patch("cvec.cvec.urlopen")
-    def test_cache_stores_new_response(
-        self,
-        mock_urlopen: Any,
-        mock_fetch_key: Any,
-        mock_login: Any,
-    ) -> None:
+    def test_cache_stores_new_response(self, mock_urlopen: Any) -> None:
         """First GET stores the response in cache with correct max-age and etag."""
         client = _create_client()
 
@@ -126,20 +103,8 @@ class TestHttpCache:
         assert entry.etag == '"etag1"'
         assert entry.max_age == 300
 
-    @patch.object(CVec, "_login_with_supabase", return_value=None)
-    @patch.object(
-        CVec,
-        "_fetch_config",
-        autospec=True,
-        side_effect=mock_fetch_config_side_effect,
-    )
     @patch("cvec.cvec.urlopen")
-    def test_fresh_cache_hit_returns_cached_data(
-        self,
-        mock_urlopen: Any,
-        mock_fetch_key: Any,
-        mock_login: Any,
-    ) -> None:
+    def test_fresh_cache_hit_returns_cached_data(self, mock_urlopen: Any) -> None:
         """GET request with fresh cache entry returns data without HTTP call."""
         client = _create_client()
 
@@ -160,20 +125,8 @@ class TestHttpCache:
         assert mock_urlopen.call_count == 1  # no additional call
         assert result1 == result2
 
-    @patch.object(CVec, "_login_with_supabase", return_value=None)
-    @patch.object(
-        CVec,
-        "_fetch_config",
-        autospec=True,
-        side_effect=mock_fetch_config_side_effect,
-    )
     @patch("cvec.cvec.urlopen")
-    def test_stale_cache_with_etag_sends_if_none_match(
-        self,
-        mock_urlopen: Any,
-        mock_fetch_key: Any,
-        mock_login: Any,
-    ) -> None:
+    def test_stale_cache_with_etag_sends_if_none_match(self, mock_urlopen: Any) -> None:
         """Stale entry triggers conditional request with If-None-Match."""
         client = _create_client()
 
@@ -207,20 +160,8 @@ class TestHttpCache:
         req = mock_urlopen.call_args[0][0]
         assert req.get_header("If-none-match") == '"etag1"'
 
-    @patch.object(CVec, "_login_with_supabase", return_value=None)
-    @patch.object(
-        CVec,
-        "_fetch_config",
-        autospec=True,
-        side_effect=mock_fetch_config_side_effect,
-    )
     @patch("cvec.cvec.urlopen")
-    def test_304_response_returns_cached_data(
-        self,
-        mock_urlopen: Any,
-        mock_fetch_key: Any,
-        mock_login: Any,
-    ) -> None:
+    def test_304_response_returns_cached_data(self, mock_urlopen: Any) -> None:
         """304 response returns cached data and refreshes stored_at."""
         client = _create_client()
 
@@ -257,20 +198,8 @@ class TestHttpCache:
         # stored_at should be refreshed
         assert client._cache[url].stored_at > old_stored_at
 
-    @patch.object(CVec, "_login_with_supabase", return_value=None)
-    @patch.object(
-        CVec,
-        "_fetch_config",
-        autospec=True,
-        side_effect=mock_fetch_config_side_effect,
-    )
     @patch("cvec.cvec.urlopen")
-    def test_post_request_not_cached(
-        self,
-        mock_urlopen: Any,
-        mock_fetch_key: Any,
-        mock_login: Any,
-    ) -> None:
+    def test_post_request_not_cached(self, mock_urlopen: Any) -> None:
         """POST request bypasses cache entirely."""
         client = _create_client()
 
@@ -285,20 +214,8 @@ class TestHttpCache:
 
         assert len(client._cache) == 0
 
-    @patch.object(CVec, "_login_with_supabase", return_value=None)
-    @patch.object(
-        CVec,
-        "_fetch_config",
-        autospec=True,
-        side_effect=mock_fetch_config_side_effect,
-    )
     @patch("cvec.cvec.urlopen")
-    def test_no_cache_control_header_not_cached(
-        self,
-        mock_urlopen: Any,
-        mock_fetch_key: Any,
-        mock_login: Any,
-    ) -> None:
+    def test_no_cache_control_header_not_cached(self, mock_urlopen: Any) -> None:
         """Response without Cache-Control max-age is not cached."""
         client = _create_client()
 
@@ -312,20 +229,8 @@ class TestHttpCache:
 
         assert len(client._cache) == 0
 
-    @patch.object(CVec, "_login_with_supabase", return_value=None)
-    @patch.object(
-        CVec,
-        "_fetch_config",
-        autospec=True,
-        side_effect=mock_fetch_config_side_effect,
-    )
     @patch("cvec.cvec.urlopen")
-    def test_different_urls_cached_separately(
-        self,
-        mock_urlopen: Any,
-        mock_fetch_key: Any,
-        mock_login: Any,
-    ) -> None:
+    def test_different_urls_cached_separately(self, mock_urlopen: Any) -> None:
         """Two different URLs get separate cache entries."""
         client = _create_client()
 
@@ -356,20 +261,8 @@ class TestHttpCache:
 
         assert len(client._cache) == 2
 
-    @patch.object(CVec, "_login_with_supabase", return_value=None)
-    @patch.object(
-        CVec,
-        "_fetch_config",
-        autospec=True,
-        side_effect=mock_fetch_config_side_effect,
-    )
     @patch("cvec.cvec.urlopen")
-    def test_cache_evicts_when_full(
-        self,
-        mock_urlopen: Any,
-        mock_fetch_key: Any,
-        mock_login: Any,
-    ) -> None:
+    def test_cache_evicts_when_full(self, mock_urlopen: Any) -> None:
         """When cache is full, the entry with earliest expiration is evicted."""
         client = _create_client()
 
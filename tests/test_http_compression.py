@@ -4,17 +4,12 @@ import gzip
 import json
 import zlib
 from typing import Any
-from unittest.mock import Mock, patch
+from unittest.mock import patch
 
 import brotli  # type: ignore[import-untyped]
 
 from cvec import CVec
-
-
-def mock_fetch_config_side_effect(instance: CVec) -> str:
-    """Side effect for _fetch_config mock that sets tenant_id."""
-    instance._tenant_id = 1
-    return "test_publishable_key"
+from tests.stubs import API_KEY, StaticResponse
 
 
 def _make_mock_response(
@@ -22,27 +17,21 @@ def _make_mock_response(
     content_type: str = "application/json",
     content_encoding: str = "",
     extra_headers: dict[str, str] | None = None,
-) -> Mock:
+) -> StaticResponse:
     """Create a mock HTTP response with the given body and headers."""
-    mock_response = Mock()
-    mock_response.read.return_value = body
-
     headers: dict[str, str] = {"content-type": content_type}
     if content_encoding:
         headers["Content-Encoding"] = content_encoding
     if extra_headers:
         headers.update(extra_headers)
-    mock_response.headers = headers
-    mock_response.__enter__ = Mock(return_value=mock_response)
-    mock_response.__exit__ = Mock(return_value=False)
-    return mock_response
+    return StaticResponse(body, headers)
 
 
 def _create_client() -> CVec:
-    """Create a CVec client with mocked auth."""
+    """Create a CVec client; conftest stubs its config fetch and login."""
     client = CVec(
         host="https://test.example.com",
-        api_key="cva_hHs0CbkKALxMnxUdI9hanF0TBPvvvr1HjG6O",
+        api_key=API_KEY,
     )
     client._access_token = "test_token"
     return client
@@ -51,20 +40,8 @@ def _create_client() -> CVec:
 class TestHttpCompression:
     """Test cases for HTTP compression support."""
 
-    @patch.object(CVec, "_login_with_supabase", return_value=None)
-    @patch.object(
-        CVec,
-        "_fetch_config",
-        autospec=True,
-        side_effect=mock_fetch_config_side_effect,
-    )
     @patch("cvec.cvec.urlopen")
-    def test_accept_encoding_header_sent(
-        self,
-        mock_urlopen: Any,
-        mock_fetch_key: Any,
-        mock_login: Any,
-    ) -> None:
+    def test_accept_encoding_header_sent(self, mock_urlopen: Any) -> None:
         """Verify Accept-Encoding includes br, gzip, deflate."""
         client = _create_client()
 
@@ -76,20 +53,8 @@ class TestHttpCompression:
         req = mock_urlopen.call_args[0][0]
         assert req.get_header("Accept-encoding") == "br, gzip, deflate"
 
-    @patch.object(CVec, "_login_with_supabase", return_value=None)
-    @patch.object(
-        CVec,
-        "_fetch_config",
-        autospec=True,
-        side_effect=mock_fetch_config_side_effect,
-    )
     @patch("cvec.cvec.urlopen")
-    def test_gzip_response_decompressed(
-        self,
-        mock_urlopen: Any,
-        mock_fetch_key: Any,
-        mock_login: Any,
-    ) -> None:
+    def test_gzip_response_decompressed(self, mock_urlopen: Any) -> None:
         """Mock a gzip-compressed JSON response, verify it is decompressed."""
         client = _create_client()
 
@@ -102,20 +67,8 @@ class TestHttpCompression:
         assert len(result) == 1
         assert result[0].name == "metric1"
 
-    @patch.object(CVec, "_login_with_supabase", return_value=None)
-    @patch.object(
-        CVec,
-        "_fetch_config",
-        autospec=True,
-        side_effect=mock_fetch_config_side_effect,
-    )
     @patch("cvec.cvec.urlopen")
-    def test_deflate_response_decompressed(
-        self,
-        mock_urlopen: Any,
-        mock_fetch_key: Any,
-        mock_login: Any,
-    ) -> None:
+    def test_deflate_response_decompressed(self, mock_urlopen: Any) -> None:
         """Mock a deflate-compressed JSON response, verify decompression."""
         client = _create_client()
 
@@ -129,20 +82,8 @@ class TestHttpCompression:
         assert len(result) == 1
         assert result[0].name == "metric2"
 
-    @patch.object(CVec, "_login_with_supabase", return_value=None)
-    @patch.object(
-        CVec,
-        "_fetch_config",
-        autospec=True,
-        side_effect=mock_fetch_config_side_effect,
-    )
     @patch("cvec.cvec.urlopen")
-    def test_uncompressed_response_unchanged(
-        self,
-        mock_urlopen: Any,
-        mock_fetch_key: Any,
-        mock_login: Any,
-    ) -> None:
+    def test_uncompressed_response_unchanged(self, mock_urlopen: Any) -> None:
         """Verify responses without Content-Encoding still work."""
         client = _create_client()
 
@@ -154,20 +95,8 @@ class TestHttpCompression:
         assert len(result) == 1
         assert result[0].name == "metric3"
 
-    @patch.object(CVec, "_login_with_supabase", return_value=None)
-    @patch.object(
-        CVec,
-        "_fetch_config",
-        autospec=True,
-        side_effect=mock_fetch_config_side_effect,
-    )
     @patch("cvec.cvec.urlopen")
-    def test_gzip_arrow_response_decompressed(
-        self,
-        mock_urlopen: Any,
-        mock_fetch_key: Any,
-        mock_login: Any,
-    ) -> None:
+    def test_gzip_arrow_response_decompressed(self, mock_urlopen: Any) -> None:
         """Verify binary Arrow responses with gzip encoding are decompressed."""
         client = _create_client()
 
@@ -199,20 +128,8 @@ class TestHttpCompression:
         assert isinstance(result, bytes)
         assert result == arrow_bytes
 
-    @patch.object(CVec, "_login_with_supabase", return_value=None)
-    @patch.object(
-        CVec,
-        "_fetch_config",
-        autospec=True,
-        side_effect=mock_fetch_config_side_effect,
-    )
     @patch("cvec.cvec.urlopen")
-    def test_brotli_response_decompressed(
-        self,
-        mock_urlopen: Any,
-        mock_fetch_key: Any,
-        mock_login: Any,
-    ) -> None:
+    def test_brotli_response_decompressed(self, mock_urlopen: Any) -> None:
         """Mock a brotli-compressed JSON response, verify it is decompressed."""
         client = _create_client()
 
@@ -1,61 +1,77 @@
 """Tests for token refresh functionality."""
 
+from collections.abc import Callable
 from typing import Any
-from unittest.mock import Mock, patch
-from urllib.error import HTTPError
+from unittest.mock import Mock
+from urllib.error import HTTPError, URLError
 
 import pytest
 
 from cvec import CVec
+from tests.stubs import StaticResponse
 
 
-def mock_fetch_config_side_effect(instance: CVec) -> str:
-    """Side effect for _fetch_config mock that sets tenant_id."""
-    instance._tenant_id = 1
-    return "test_publishable_key"
+def _http_401() -> HTTPError:
+    """A fresh 401 per test; a shared one would accumulate traceback and context."""
+    return HTTPError(
+        url="https://test.example.com/api/metrics/",
+        code=401,
+        msg="Unauthorized",
+        hdrs={},  # type: ignore[arg-type]
+        fp=None,
+    )
+
+
+# Successful response after refresh; stateless, so tests can share it.
+_EMPTY_JSON_RESPONSE = StaticResponse(b"[]", {"content-type": "application/json"})
+
+
+@pytest.fixture
+def client(client: CVec) -> CVec:
+    """The shared client, with an expired access token that can be refreshed."""
+    client._access_token = "expired_token"
+    client._refresh_token = "valid_refresh_token"
+    return client
+
+
+@pytest.fixture
+def mock_urlopen(monkeypatch: pytest.MonkeyPatch) -> Mock:
+    """Replace the urlopen used by cvec.cvec with a Mock for the test."""
+    mock = Mock()
+    monkeypatch.setattr("cvec.cvec.urlopen", mock)
+    return mock
+
+
+@pytest.fixture(params=["make_request", "query_table", "call_rpc"])
+def send(request: pytest.FixtureRequest, client: CVec) -> Callable[[], Any]:
+    """Issue one public call through each transport that retries on 401.
+
+    The internal ``_make_request``, ``_query_table`` and ``_call_rpc`` each carry
+    their own copy of the refresh-and-retry logic, so every scenario runs against
+    all three, reached through a public method as users would hit them.
+    """
+    transports: dict[str, Callable[[], Any]] = {
+        "make_request": client.get_metrics,
+        "query_table": client.get_eav_tables,
+        "call_rpc": lambda: client.select_from_eav_id(table_id="test_table_id"),
+    }
+    return transports[request.param]
 
 
 class TestTokenRefresh:
     """Test cases for automatic token refresh functionality."""
 
-    @patch.object(CVec, "_login_with_supabase", return_value=None)
-    @patch.object(
-        CVec, "_fetch_config", autospec=True, side_effect=mock_fetch_config_side_effect
-    )
-    @patch("cvec.cvec.urlopen")
     def test_token_refresh_on_401(
         self,
-        mock_urlopen: Any,
-        mock_fetch_key: Any,
-        mock_login: Any,
+        mock_urlopen: Mock,
+        client: CVec,
+        send: Callable[[], Any],
+        monkeypatch: pytest.MonkeyPatch,
     ) -> None:
         """Test that token refresh is triggered on 401 Unauthorized."""
-        client = CVec(
-            host="https://test.example.com",
-            api_key="cva_hHs0CbkKALxMnxUdI9hanF0TBPvvvr1HjG6O",
-        )
-
-        client._access_token = "expired_token"
-        client._refresh_token = "valid_refresh_token"
-
-        http_error_401 = HTTPError(
-            url="https://test.example.com/api/metrics/",
-            code=401,
-            msg="Unauthorized",
-            hdrs={},  # type: ignore[arg-type]
-            fp=None,
-        )
-
-        # Mock successful response after refresh
-        mock_success_response = Mock()
-        mock_success_response.read.return_value = b"[]"
-        mock_success_response.headers = {"content-type": "application/json"}
-        mock_success_response.__enter__ = Mock(return_value=mock_success_response)
-        mock_success_response.__exit__ = Mock(return_value=False)
-
         mock_urlopen.side_effect = [
-            http_error_401,
-            mock_success_response,
+            _http_401(),
+            _EMPTY_JSON_RESPONSE,
         ]
 
         # Mock refresh method
@@ -65,98 +81,43 @@ class TestTokenRefresh:
             refresh_called.append(True)
             client._access_token = "new_token"
 
-        with patch.object(client, "_refresh_supabase_token", side_effect=mock_refresh):
-            # Execute request
-            result = client.get_metrics()
+        monkeypatch.setattr(client, "_refresh_supabase_token", mock_refresh)
+
+        # Execute request
+        result = send()
 
         # Verify refresh was called
         assert len(refresh_called) == 1
         assert client._access_token == "new_token"
         assert result == []
 
-    @patch.object(CVec, "_login_with_supabase", return_value=None)
-    @patch.object(
-        CVec, "_fetch_config", autospec=True, side_effect=mock_fetch_config_side_effect
+    @pytest.mark.parametrize(
+        ("error_type", "message"),
+        [
+            pytest.param(URLError, "Network unreachable", id="network_error"),
+            pytest.param(
+                ValueError, "No refresh token available", id="missing_refresh_token"
+            ),
+        ],
     )
-    @patch("cvec.cvec.urlopen")
-    def test_token_refresh_handles_network_errors_gracefully(
+    def test_token_refresh_failure_raises_original_401(
         self,
-        mock_urlopen: Any,
-        mock_fetch_key: Any,
-        mock_login: Any,
+        mock_urlopen: Mock,
+        client: CVec,
+        send: Callable[[], Any],
+        monkeypatch: pytest.MonkeyPatch,
+        error_type: type[Exception],
+        message: str,
     ) -> None:
-        """Test that network errors during refresh don't crash, returns original error."""
-        from urllib.error import URLError
-
-        client = CVec(
-            host="https://test.example.com",
-            api_key="cva_hHs0CbkKALxMnxUdI9hanF0TBPvvvr1HjG6O",
-        )
+        """Test that a failed refresh doesn't crash and re-raises the original 401."""
+        mock_urlopen.side_effect = _http_401()
 
-        client._access_token = "expired_token"
-        client._refresh_token = "valid_refresh_token"
-
-        # Mock 401 error response
-        http_error_401 = HTTPError(
-            url="https://test.example.com/api/metrics/",
-            code=401,
-            msg="Unauthorized",
-            hdrs={},  # type: ignore[arg-type]
-            fp=None,
-        )
+        def mock_refresh_with_error() -> None:
+            raise error_type(message)
 
-        mock_urlopen.side_effect = http_error_401
+        monkeypatch.setattr(client, "_refresh_supabase_token", mock_refresh_with_error)
 
-        # Mock refresh to raise network error
-        def mock_refresh_with_error() -> None:
-            raise URLError("Network unreachable")
-
-        with patch.object(
-            client, "_refresh_supabase_token", side_effect=mock_refresh_with_error
-        ):
-            # Should not crash, should raise the original 401 error
-            with pytest.raises(HTTPError) as exc_info:
-                client.get_metrics()
-            assert exc_info.value.code == 401
-
-    @patch.object(CVec, "_login_with_supabase", return_value=None)
-    @patch.object(
-        CVec, "_fetch_config", autospec=True, side_effect=mock_fetch_config_side_effect
-    )
-    @patch("cvec.cvec.urlopen")
-    def test_token_refresh_handles_missing_refresh_token(
-        self,
-        mock_urlopen: Any,
-        mock_fetch_key: Any,
-        mock_login: Any,
-    ) -> None:
-        """Test that missing refresh token is handled gracefully."""
-        client = CVec(
-            host="https://test.example.com",
-            api_key="cva_hHs0CbkKALxMnxUdI9hanF0TBPvvvr1HjG6O",
-        )
-
-        client._access_token = "expired_token"
-        client._refresh_token = "valid_refresh_token"
-
-        http_error_401 = HTTPError(
-            url="https://test.example.com/api/metrics/",
-            code=401,
-            msg="Unauthorized",
-            hdrs={},  # type: ignore[arg-type]
-            fp=None,
-        )
-
-        mock_urlopen.side_effect = http_error_401
-
-        # Mock refresh to raise ValueError (missing refresh token)
-        def mock_refresh_with_error() -> None:
-            raise ValueError("No refresh token available")
-
-        with patch.object(
-            client, "_refresh_supabase_token", side_effect=mock_refresh_with_error
-        ):
-            # Should not crash, should raise the original 401 error
-            with pytest.raises(HTTPError) as exc_info:
-                client.get_metrics()
-            assert exc_info.value.code == 401
+        # Should not crash, should raise the original 401 error
+        with pytest.raises(HTTPError) as exc_info:
+            send()
+        assert exc_info.value.code == 401